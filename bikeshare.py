@@ -1,5 +1,8 @@
+import functools
 import os
 import platform
+import sys
+import tempfile
 import time
 import pandas as pd
 import numpy as np
@@ -25,7 +28,125 @@ CITY_DATA = {
     'washington': 'washington.csv'
 }
 
+# Version of the Parquet cache layout (bump when the cached columns change, to force a rebuild)
+PARQUET_VERSION = 5
 
+# Low-cardinality text columns, stored as categories
+CATEGORY_COLS = {'Start Station': 'category', 'End Station': 'category', 'User Type': 'category', 'Gender': 'category'}
+
+# Day names in pandas dayofweek order (Monday = 0), used to map between day names and day numbers
+DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+
+def _parquet_path(city):
+    """
+    Returns the path of the Parquet cache file for a city, next to its CSV file.
+
+    Args:
+        city (str): City selected by user ('chicago', 'new york', 'washington')
+
+    Returns:
+        str: Path of the Parquet file (e.g. 'chicago.v5.parquet').
+    """
+    return f'{os.path.splitext(CITY_DATA[city])[0]}.v{PARQUET_VERSION}.parquet'
+
+
+def _read_city_csv(city):
+    """
+    Reads the city CSV file into the compact layout that is cached as Parquet.
+
+    All source columns are kept, because the raw data view shows them (including the original trip id
+    in the unnamed first column and 'End Time'). 'Start Time' and 'End Time' are native datetimes, the
+    'month', 'day_of_week' and 'hour' columns are pre-extracted, and dtypes are compact (downcast/categorical).
+
+    Args:
+        city (str): City selected by user ('chicago', 'new york', 'washington')
+
+    Returns:
+        pandas.DataFrame: All bikeshare data for the city, including 'month', 'day_of_week' and 'hour'.
+    """
+    csv_path = CITY_DATA[city]
+
+    # Read text columns as categories where possible. Check the header first, as 'Gender' and
+    # 'Birth Year' are not in every file
+    header = pd.read_csv(csv_path, nrows=0).columns
+    dtypes = {col: dtype for col, dtype in CATEGORY_COLS.items() if col in header}
+    
+    # Parse with the multi-threaded pyarrow engine. The source files use a fixed timestamp format,
+    # so parse with it instead of inferring it per value
+    df = pd.read_csv(csv_path, engine='pyarrow', dtype=dtypes,
+                     parse_dates=['Start Time', 'End Time'], date_format='%Y-%m-%d %H:%M:%S')
+    # The pyarrow engine leaves the unnamed trip id column without a name; use the usual pandas names
+    df.columns = header
+
+    # Extract 'month', 'day_of_week' and 'hour' from 'Start Time' column for filtering
+    df['month'] = df['Start Time'].dt.month.astype('int8')
+    df['day_of_week'] = df['Start Time'].dt.dayofweek.astype('int8') # Day number (Monday = 0), see DAYS
+    df['hour'] = df['Start Time'].dt.hour.astype('int8')
+
+    # Shrink the trip duration column
+    df['Trip Duration'] = pd.to_numeric(df['Trip Duration'], downcast='integer')
+
+    return df
+
+
+def _write_parquet(df, parquet_path):
+    """
+    Writes the Parquet cache file atomically: a temporary file in the same folder is renamed onto
+    the final path, so an interrupted write never leaves a partial cache file behind.
+
+    Args:
+        df (pandas.DataFrame): City data, from _read_city_csv()
+        parquet_path (str): Final path of the Parquet file
+
+    Returns:
+        None
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(parquet_path) or '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, parquet_path)
+    finally:
+        # Only left behind if the write or rename failed
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@functools.lru_cache(maxsize=3)
+def _load_city_data(city):
+    """
+    Loads the complete data for a city once per session; later calls reuse the cached DataFrame.
+
+    The data is read from the Parquet copy of the city CSV file. The Parquet file is (re)built from
+    the CSV whenever it is missing or older than the CSV. If it cannot be written (e.g. the folder is
+    read-only), the data read from the CSV is used as is.
+
+    The returned DataFrame is shared between calls, so callers must not modify it in place.
+
+    Args:
+        city (str): City selected by user ('chicago', 'new york', 'washington')
+
+    Returns:
+        pandas.DataFrame: All bikeshare data for the city, including 'month', 'day_of_week' and 'hour'.
+    """
+    csv_path = CITY_DATA[city]
+    parquet_path = _parquet_path(city)
+
+    # Reuse the existing Parquet file unless the CSV has changed since it was written
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        return pd.read_parquet(parquet_path, engine='pyarrow')
+
+    df = _read_city_csv(city)
+    try:
+        _write_parquet(df, parquet_path)
+    except OSError as e:
+        # Caching is only an optimization, so carry on with the data read from the CSV
+        print(f'{YELLOW}* Could not save the Parquet cache ({e}), using the CSV data{ENDC}')
+    return df
+
+
+@functools.lru_cache(maxsize=None)
 def get_filter_description(city, month, day):
     """
     Creates a consistent filter description string based on selected city, month, and day.
@@ -102,7 +223,7 @@ def get_filters():
     )
 
     # Validate day input
-    valid_days = ['all', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    valid_days = ['all'] + DAYS
     day = get_valid_input(
         'Which day? All, Monday, Tuesday, Wednesday, Thursday, Friday, Saturday, or Sunday?\n',
         valid_days,
@@ -116,9 +237,10 @@ def load_data(city, month, day):
     """
     Loads and filters data based on user selections.
 
-    This function reads the appropriate CSV file, extracts relevant components from the 
-    'Start Time' column (month, day of the week, and hour), and then filters 
-    this data based on the user's preferences for month and day. It returns the filtered dataset.
+    This function reads the appropriate city data (converted once from CSV to Parquet, with the
+    month, day of the week and hour already extracted from the 'Start Time' column), and then filters 
+    this data based on the user's preferences for month and day. The city data is only read once per
+    session, so restarting with the same city just re-applies the filters. It returns the filtered dataset.
     
     Args:
         city (str): City selected by user ('chicago', 'new york', 'washington')
@@ -135,15 +257,8 @@ def load_data(city, month, day):
     print()
     
     try:
-        # Load the relevant city data CSV file, based on user's selection
-        df = pd.read_csv(CITY_DATA[city])
-        # Convert time columns to datetime format for easier manipulation
-        df['Start Time'] = pd.to_datetime(df['Start Time'])
-        
-        # Extract 'month', 'day_of_week' and 'hour' from 'Start Time' column for filtering
-        df['month'] = df['Start Time'].dt.month
-        df['day_of_week'] = df['Start Time'].dt.day_name()
-        df['hour'] = df['Start Time'].dt.hour
+        # Load the relevant city data, based on user's selection (cached for the session)
+        df = _load_city_data(city)
 
         # Filter by selected month (unless 'all')
         if month != 'all':
@@ -154,10 +269,10 @@ def load_data(city, month, day):
             # Filter dataframe records by selected month.
             df = df[df['month'] == month_num]
         
-        # Filter by selected day (unless 'all') 
+        # Filter by selected day (unless 'all') - 'day_of_week' is stored as a day number
         if day != 'all':
             # Filter dataframe to only include records for the selected day.
-            df = df[df['day_of_week'].str.lower() == day.lower()]
+            df = df[df['day_of_week'] == DAYS.index(day.lower())]
         
         # Return the filtered dataframe
         return df
@@ -175,98 +290,163 @@ def load_data(city, month, day):
 
 def display_header(city, month, day):
     """Displays the report header with filter selections."""
+    # Output lines are collected and written in one go at the end
+    lines = []
     
     # Use helper function to get formatted status line
     status_line = get_filter_description(city, month, day)
     
     # Print the status line and separator
-    print(status_line)
-    print('-' * len(status_line))
-    print()
+    lines.append(status_line)
+    lines.append('-' * len(status_line))
+    lines.append('')
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def compute_aggs(df):
+    """
+    Calculates all aggregates used by the statistics sections in one place, scanning each column once.
+
+    Args:
+        df (pandas.DataFrame): Filtered data
+
+    Returns:
+        dict: Aggregates for the display functions:
+            - total_rides (int): Number of rides
+            - hour_counts (numpy.ndarray): Rides per hour, indexed by hour (0-23)
+            - start_vc / end_vc (pandas.Series): Rides per start/end station, unsorted
+            - route_vc (pandas.Series): Rides per (start station, end station) pair
+            - total_duration / avg_duration (float): Total and average 'Trip Duration' in seconds
+            - user_type_vc (pandas.Series): Rides per user type
+            - subscriber_total (int): Number of subscriber rides
+            - gender_vc (pandas.Series or None): Subscriber rides per gender (NaN included), None if unavailable
+            - birth_agg (dict or None): Subscriber birth year 'min', 'max' and 'common', None if unavailable
+    """
+    aggs = {'total_rides': len(df)}
 
+    # Ride counts per hour, as a single 24-bin count (no hashing or sorting)
+    aggs['hour_counts'] = np.bincount(df['hour'].to_numpy(), minlength=24)
 
-def display_ride_stats(df):
+    # Station and route counts (NaN stations are excluded). Only the top station is needed, so skip sorting
+    aggs['start_vc'] = df['Start Station'].value_counts(sort=False)
+    aggs['end_vc'] = df['End Station'].value_counts(sort=False)
+    aggs['route_vc'] = df.groupby(['Start Station', 'End Station'], observed=True, sort=False).size()
+
+    # Trip durations (on the numpy array, skipping the pandas dispatch; nan-aware like pandas)
+    durations = df['Trip Duration'].to_numpy()
+    aggs['total_duration'] = np.nansum(durations)
+    aggs['avg_duration'] = np.nanmean(durations)
+
+    # User types (skip categories not present in the filtered data)
+    user_types = df['User Type'].value_counts()
+    aggs['user_type_vc'] = user_types[user_types > 0]
+
+    # Gender and birth year are only available for some cities, and are reported for subscribers only.
+    # Find the subscriber rows once, and only take the two columns needed from them
+    subscriber_idx = np.flatnonzero((df['User Type'] == 'Subscriber').to_numpy())
+    aggs['subscriber_total'] = subscriber_idx.size
+
+    aggs['gender_vc'] = None
+    if 'Gender' in df.columns:
+        gender_counts = df['Gender'].iloc[subscriber_idx].value_counts(dropna=False) # Keeps category codes
+        gender_counts = gender_counts[gender_counts > 0]
+        if not gender_counts.empty:
+            aggs['gender_vc'] = gender_counts
+
+    aggs['birth_agg'] = None
+    if 'Birth Year' in df.columns:
+        birth_years = df['Birth Year'].to_numpy()[subscriber_idx]
+        birth_years = birth_years[~np.isnan(birth_years)]
+        if birth_years.size:
+            # Single counting pass for the most common year (mode() would count and sort again)
+            years, year_counts = np.unique(birth_years, return_counts=True)
+            aggs['birth_agg'] = {
+                'min': int(years[0]), # np.unique returns the years sorted
+                'max': int(years[-1]),
+                'common': int(years[year_counts.argmax()])
+            }
+
+    return aggs
+
+
+def display_ride_stats(aggs):
     """
     Displays ride statistics for the filtered data:
         - Total rides
         - Busiets and quietest hours
-        - Calculation time
     
     Args:
-        df (pandas.DataFrame): Filtered data
+        aggs (dict): Aggregates of the filtered data, from compute_aggs()
 
     Returns:
         None
     """
-    # Start timer for calculations
-    start_time = time.time()
+    # Output lines are collected and written in one go at the end
+    lines = []
     
     # Section heading
-    print(f'{GREEN}Ride Count Statistics{ENDC}')
-    print()
+    lines.append(f'{GREEN}Ride Count Statistics{ENDC}')
+    lines.append('')
     
     # Subheading for ride count
-    print(f'Total Rides │ {len(df):,}')
-    print()
+    lines.append(f'Total Rides │ {aggs["total_rides"]:,}')
+    lines.append('')
     
     # Subheading for hour
-    print('Hours:')
-    hourly_rides = df['hour'].value_counts().sort_index()
-    busiest_hour = hourly_rides.idxmax()
-    quietest_hour = hourly_rides.idxmin()
+    lines.append('Hours:')
+    hourly_rides = aggs['hour_counts']
+    busiest_hour = int(hourly_rides.argmax())
+    # Quietest hour among the hours with rides (hours without any rides are not reported)
+    quietest_hour = int(np.where(hourly_rides > 0, hourly_rides, np.iinfo(hourly_rides.dtype).max).argmin())
     
     # Display the hour data
-    print(f'Busiest     │ {busiest_hour:02d}:00 ({hourly_rides[busiest_hour]:,} rides)')
-    print(f'Quietest    │ {quietest_hour:02d}:00 ({hourly_rides[quietest_hour]:,} rides)')
+    lines.append(f'Busiest     │ {busiest_hour:02d}:00 ({hourly_rides[busiest_hour]:,} rides)')
+    lines.append(f'Quietest    │ {quietest_hour:02d}:00 ({hourly_rides[quietest_hour]:,} rides)')
+    lines.append('')
     
-    # Stop timer and display the calculation time (3 decimals)
-    print()
-    print(f'{MAGENTA}Calculation time: {time.time() - start_time:.3f}s{ENDC}')
-    print()
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
-def display_station_stats(df):
+def display_station_stats(aggs):
     """
     Displays station statistics for the filtered data:
         - Most popular start and end stations
         - Most popular route (start and end station)
-        - Calculation time
     
-    Handles missing data by excluding NaN values in the station columns. The most popular
-    route is calculated by combining the 'Start Station' and 'End Station' columns and finding
-    the most frequent combination.
+    Missing station data (NaN) is excluded from the counts. The most popular route is the
+    'Start Station' and 'End Station' pair with the most trips.
 
     Args:
-        df (pandas.DataFrame): Filtered data containing 'Start Station' and 'End Station' columns.
+        aggs (dict): Aggregates of the filtered data, from compute_aggs()
 
     Returns:
         None
     """
-    start_time = time.time()
+    # Output lines are collected and written in one go at the end
+    lines = []
     
-    print(f'{GREEN}Station Statistics{ENDC}')
-    print()
+    lines.append(f'{GREEN}Station Statistics{ENDC}')
+    lines.append('')
 
-    print('Most Popular Stations:')
-    start_station_counts = df['Start Station'].dropna().value_counts() # NaN handling
-    end_station_counts = df['End Station'].dropna().value_counts() # Nan handling
+    lines.append('Most Popular Stations:')
+    start_station = aggs['start_vc'].idxmax()
+    end_station = aggs['end_vc'].idxmax()
     
-    print(f'Start       │ {start_station_counts.index[0]} ({start_station_counts.iloc[0]:,} rides)')
-    print(f'End         │ {end_station_counts.index[0]} ({end_station_counts.iloc[0]:,} rides)')
-    print()
+    lines.append(f'Start       │ {start_station} ({aggs["start_vc"][start_station]:,} rides)')
+    lines.append(f'End         │ {end_station} ({aggs["end_vc"][end_station]:,} rides)')
+    lines.append('')
     
-    # Calculate most popular route by combining start and end stations (with NaN handling)
-    route_series = df['Start Station'].dropna() + ' to ' + df['End Station'].dropna()
-    popular_route = route_series.mode()[0]
-    route_count = route_series.value_counts().iloc[0]
+    # Most popular route, from the start/end station pair counts
+    top_route = aggs['route_vc'].nlargest(1)
+    (route_start, route_end), route_count = top_route.index[0], top_route.iloc[0]
+    popular_route = f'{route_start} to {route_end}'
     
-    print('Most Popular Route:')
-    print(f'{popular_route} ({route_count:,} rides)')
+    lines.append('Most Popular Route:')
+    lines.append(f'{popular_route} ({route_count:,} rides)')
+    lines.append('')
     
-    # Stop timer and display the calculation time (3 decimals)
-    print()
-    print(f'{MAGENTA}Calculation time: {time.time() - start_time:.3f}s{ENDC}')
-    print()
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def format_time(seconds):
@@ -290,124 +470,107 @@ def format_time(seconds):
     return f'{hours}h {minutes}m {seconds}s'
 
 
-def display_trip_duration_stats(df):
+def display_trip_duration_stats(aggs):
     """
     Displays trip duration statistics for the filtered dataframe.
     
     Args:
-        df (pandas.DataFrame): Filtered data
+        aggs (dict): Aggregates of the filtered data, from compute_aggs()
 
     Returns:
         None
     """
-    # Start timer for calculations
-    start_time = time.time()
+    # Output lines are collected and written in one go at the end
+    lines = []
     
     # Heading for trip duration statistics section
-    print(f'{GREEN}Trip Duration Statistics{ENDC}')
-    print()
-    
-    # Calculate total and average trip durations from the 'Trip Duration' column
-    total_duration = df['Trip Duration'].sum()
-    avg_duration = df['Trip Duration'].mean()
+    lines.append(f'{GREEN}Trip Duration Statistics{ENDC}')
+    lines.append('')
     
     # Display the total and average trip durations using formatted time
-    print(f'Total Time  │ {format_time(total_duration)}')
-    print(f'Average Time│ {format_time(avg_duration)}')
+    lines.append(f'Total Time  │ {format_time(aggs["total_duration"])}')
+    lines.append(f'Average Time│ {format_time(aggs["avg_duration"])}')
+    lines.append('')
     
-    # Stop timer and display the calculation time (3 decimals)
-    print()
-    print(f'{MAGENTA}Calculation time: {time.time() - start_time:.3f}s{ENDC}')
-    print()
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 # Import datetime to calculate age of users, based on current year
 from datetime import datetime
 
 
-def display_user_stats(df):
+def format_count_lines(counts, total, decimals):
+    """
+    Formats category counts as display lines with their share of the total, without a per-row loop.
+
+    Args:
+        counts (pandas.Series): Counts per category (e.g. from value_counts), NaN index shown as 'Unknown'
+        total (int): Total used to calculate the percentages
+        decimals (int): Number of decimals shown for the percentages
+
+    Returns:
+        str: One line per category, formatted as '<category>  │ <count> (<percentage>%)'.
+    """
+    labels = pd.Series(counts.index.astype(object), dtype=object).fillna('Unknown').astype(str).str.ljust(10)
+    values = counts.reset_index(drop=True)
+    percentages = (values / total) * 100
+    
+    lines = (labels + '  │ ' + values.map('{:,}'.format)
+             + ' (' + percentages.map(f'{{:.{decimals}f}}'.format) + '%)')
+    return '\n'.join(lines)
+
+
+def display_user_stats(aggs):
     """
     Displays user statistics for the filtered data.
     
     Args:
-        df (pandas.DataFrame): Filtered data: 'User Type', 'Gender' and 'Birth Year'.
+        aggs (dict): Aggregates of the filtered data, from compute_aggs()
 
     Returns:
         None
     """
-    # Start timer for calculations
-    start_time = time.time()
+    # Output lines are collected and written in one go at the end
+    lines = []
     
     # Print heading for user statistics section.
-    print(f'{GREEN}User Statistics{ENDC}')
-    print()
-    
-    # Calculate total users
-    total_users = len(df)
+    lines.append(f'{GREEN}User Statistics{ENDC}')
+    lines.append('')
     
     # Display user types count and percentage. 
-    user_types = df['User Type'].value_counts()
-    print('User Types:')
-    for user_type, count in user_types.items():
-        percentage = (count / total_users) * 100
-        print(f'{user_type:<10}  │ {count:,} ({percentage:.1f}%)')
-    print()
-    
-    # Check if 'Gender' or 'Birth Year' columns exist to determine if subscriber data is available.
-    has_subscriber_data = 'Gender' in df.columns or 'Birth Year' in df.columns
-    if has_subscriber_data:
-        subscriber_df = df[df['User Type'] == 'Subscriber']
-        subscriber_total = len(subscriber_df)
+    lines.append('User Types:')
+    lines.append(format_count_lines(aggs['user_type_vc'], aggs['total_rides'], 1))
+    lines.append('')
     
     # Gender (if available - subscriber data only)
-    if 'Gender' in df.columns:
-        # Filter to only look at subscriber data
-        subscriber_df = df[df['User Type'] == 'Subscriber']
-        gender_counts = subscriber_df['Gender'].value_counts(dropna=False)
-        subscriber_total = len(subscriber_df)
-        
-        # Managing missing gender data so the user understands why it's not being presented
-        if gender_counts.empty:
-            print(f'{YELLOW}* Subscriber gender data missing/unavailable for your selection{ENDC}')
-        else:
-            # Subheading for the gender, highlighting it is for subscribers only
-            print('Subscriber gender:')
-            for gender in gender_counts.index: # Iterate through all gender categories in the index
-                count = gender_counts[gender] # Get total for current gender
-                percentage = (count / subscriber_total) * 100 # Calculate percentage total for this gender
-                gender_display = 'Unknown' if pd.isna(gender) else gender # Replace NaN with 'unknown' if needed
-                print(f'{gender_display:<10}  │ {count:,} ({percentage:.0f}%)') # Display gender, count and percentage
-            print()
+    gender_counts = aggs['gender_vc']
+    
+    # Managing missing gender data so the user understands why it's not being presented
+    if gender_counts is None:
+        lines.append(f'{YELLOW}* Subscriber gender data missing/unavailable for your selection{ENDC}')
     else:
-        print(f'{YELLOW}* Subscriber gender data missing/unavailable for your selection{ENDC}')
+        # Subheading for the gender, highlighting it is for subscribers only
+        lines.append('Subscriber gender:')
+        lines.append(format_count_lines(gender_counts, aggs['subscriber_total'], 0)) # Missing gender is shown as 'Unknown'
+        lines.append('')
     
     # Birth Year (if available - subscriber data only)
-    if 'Birth Year' in df.columns:
-        subscriber_birth_years = df[df['User Type'] == 'Subscriber']['Birth Year'].dropna()
-        
-        # Managing missing birth year data so the user understands why it's not being presented
-        if subscriber_birth_years.empty:
-            print(f'{YELLOW}* Subscriber birth year data missing/unavailable for your selection{ENDC}')
-        else:
-            print('Subscriber birth year:')
-            earliest = int(subscriber_birth_years.min())
-            latest = int(subscriber_birth_years.max())
-            common = int(subscriber_birth_years.mode()[0])
-            current_year = datetime.now().year
-            print(f'Earliest    │ {earliest} (current age: {current_year - earliest})')
-            print(f'Latest      │ {latest} (current age: {current_year - latest})')
-            print(f'Most Common │ {common} (current age: {current_year - common})')
+    birth_agg = aggs['birth_agg']
+    
+    # Managing missing birth year data so the user understands why it's not being presented
+    if birth_agg is None:
+        lines.append(f'{YELLOW}* Subscriber birth year data missing/unavailable for your selection{ENDC}')
     else:
-        print(f'{YELLOW}* Subscriber birth year data missing/unavailable for your selection{ENDC}')
-
-    # Stop timer and display the calculation time (3 decimals)
-    print()
-    print(f'{MAGENTA}Calculation time: {time.time() - start_time:.3f}s{ENDC}')
-    print()
-
+        lines.append('Subscriber birth year:')
+        earliest, latest, common = birth_agg['min'], birth_agg['max'], birth_agg['common']
+        current_year = datetime.now().year
+        lines.append(f'Earliest    │ {earliest} (current age: {current_year - earliest})')
+        lines.append(f'Latest      │ {latest} (current age: {current_year - latest})')
+        lines.append(f'Most Common │ {common} (current age: {current_year - common})')
+    lines.append('')
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
 
-# Add tabulate for neater CSV data display
-from tabulate import tabulate
 
 def ask_to_continue():
     """ Helper function to ask the user if they want to continue viewing more raw data rows
@@ -423,6 +586,22 @@ def ask_to_continue():
     return response in ['yes', 'y']
 
 
+def format_raw_rows(rows):
+    """
+    Converts raw data rows to display strings (missing values shown as blanks).
+
+    Args:
+        rows (pandas.DataFrame): Raw data rows to display
+
+    Returns:
+        pandas.DataFrame: The rows as strings, with birth years shown without decimals.
+    """
+    rows = rows.copy()
+    if 'Birth Year' in rows.columns:
+        rows['Birth Year'] = rows['Birth Year'].astype('Int64') # Show years without decimals
+    return rows.astype('string').fillna('')
+
+
 def display_raw_data(df, city, month, day):
     """
     Displays raw data from the DataFrame filtered by city, month, and day.
@@ -440,13 +619,10 @@ def display_raw_data(df, city, month, day):
     if ask_to_continue():  # Directly using ask_to_continue here
         start_idx = 0
         while start_idx < len(df):
-            # Prepare table data in chunks of 5
-            chunk_end = min(start_idx + 5, len(df))
-            current_chunk = df.iloc[start_idx:chunk_end]
-            table_data = current_chunk[original_columns].fillna('').astype(str).values.tolist()
-
-            # Print the table using tabulate
-            print(tabulate(table_data, headers=original_columns, tablefmt="fancy_grid", numalign="left", stralign="left"))
+            # Print the table in chunks of 5 rows. Only the shown rows are converted to strings: converting
+            # the whole selection up front delays the first page and keeps a second copy of the data
+            chunk = format_raw_rows(df.iloc[start_idx:start_idx + 5][original_columns])
+            print(chunk.to_string(index=False))
 
             start_idx += 5
             # Check if more rows are available, or if the user wants to stop
@@ -468,10 +644,17 @@ def main():
         
         if df is not None:
             display_header(city, month, day)
-            display_ride_stats(df)
-            display_station_stats(df)
-            display_trip_duration_stats(df)
-            display_user_stats(df)
+            
+            # Calculate all statistics once, then display them section by section
+            start_time = time.time()
+            aggs = compute_aggs(df)
+            print(f'{MAGENTA}Statistics calculation time: {time.time() - start_time:.3f}s{ENDC}')
+            print()
+            
+            display_ride_stats(aggs)
+            display_station_stats(aggs)
+            display_trip_duration_stats(aggs)
+            display_user_stats(aggs)
             display_raw_data(df, city, month, day)
         
         # Display end of session message